@@ -0,0 +1,47 @@
+from datetime import date, datetime
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+COPY_NULL = '\\N'
+
+
+class _CopyNull(int):
+    """
+    The COPY NULL marker as a CSV field.
+
+    COPY only treats an unquoted field as NULL. The CSV writer runs with
+    QUOTE_NONNUMERIC, which quotes every field that isn't a number, so a
+    string that reads '\\N' stays text; being an int, this marker is
+    written unquoted.
+    """
+
+    def __str__(self):
+        return COPY_NULL
+
+
+COPY_NULL_FIELD = _CopyNull()
+
+
+def dumps_json(value: Any) -> str:
+    """Serialize a value to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def copy_value(value: Any) -> Any:
+    """Convert a Python value to its COPY CSV field, for a writer using QUOTE_NONNUMERIC."""
+    if value is None:
+        return COPY_NULL_FIELD
+    if isinstance(value, (dict, list)):
+        return dumps_json(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    return value
@@ -1,5 +1,6 @@
 from .mysql_client import MySQLClient
 from .postgresql_client import PostgreSQLClient
+from .postgresql3_client import PostgreSQL3Client
 from .mongodb_client import MongoDBClient
 from .sqlite_client import SQLiteClient
 from .sqlserver_client import SQLServerClient
@@ -19,7 +20,7 @@ class DatabaseFactory:
         Get the database instance based on the db_type.
 
         Args:
-            db_type (str): The type of the database ('mysql', 'postgresql', 'mongodb', 'sqlite', 'sqlserver', 'oracle').
+            db_type (str): The type of the database ('mysql', 'postgresql', 'postgresql3', 'mongodb', 'sqlite', 'sqlserver', 'oracle').
             config (dict): Configuration parameters for the database connection.
 
         Returns:
@@ -29,6 +30,8 @@ class DatabaseFactory:
             return MySQLClient(config)
         elif db_type == 'postgresql':
             return PostgreSQLClient(config)
+        elif db_type == 'postgresql3':
+            return PostgreSQL3Client(config)
         elif db_type == 'mongodb':
             return MongoDBClient(config)
         elif db_type == 'sqlite':
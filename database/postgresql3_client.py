@@ -0,0 +1,205 @@
+from psycopg import sql, OperationalError, DatabaseError
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
+from .base_database import BaseDatabase, DatabaseConnectionError
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+class PostgreSQL3Client(BaseDatabase):
+    """
+    PostgreSQL database connection and operations on psycopg 3.
+
+    Uses the binary protocol for query results and parameters, which avoids the
+    text conversion psycopg2 does for every numeric and timestamp value.
+
+    This is not a drop-in replacement for PostgreSQLClient: queries are plain
+    psycopg 3 strings, execute_batch_query takes one row of placeholders rather
+    than "VALUES %s", and there is no dict/{tableDate} parameter handling.
+    PostgresqlGenericCRUD needs PostgreSQLClient.
+    """
+
+    def __init__(self, config):
+        """
+        Initialize the PostgreSQL3Client class.
+
+        Args:
+            config (dict): Configuration parameters for the PostgreSQL connection.
+        """
+        super().__init__(config)
+        self.connection_pool = None
+
+    def connect(self):
+        """
+        Establish the PostgreSQL database connection.
+        Sets up connection pooling and configuration.
+        """
+        try:
+            conninfo = make_conninfo(
+                host=self.config['host'],
+                port=self.config['port'],
+                dbname=self.config['dbname'],
+                user=self.config['user'],
+                password=self.config['password'],
+                connect_timeout=self.config.get('connection_timeout', 30),
+                application_name=self.config.get('application_name', 'PostgreSQL3Client'),
+                options=self.config.get('options', '-c statement_timeout=30000'),  # 30 second query timeout
+                **self.config.get('additional_params', {})
+            )
+
+            self.connection_pool = ConnectionPool(
+                conninfo,
+                min_size=self.config.get('min_pool_size', 2),
+                max_size=self.config.get('max_pool_size', 10),
+                # Server-side prepare a statement from its second execution, so
+                # repeated metadata and CRUD queries reuse their plans
+                kwargs={'prepare_threshold': self.config.get('prepare_threshold', 2)},
+                configure=self._configure_connection,
+                open=True
+            )
+            self.connection_pool.wait()
+            logger.info("PostgreSQL Database connection pool configured successfully.")
+
+        except OperationalError as err:
+            logger.error(f"Error connecting to PostgreSQL Database: {err}")
+            raise DatabaseConnectionError(err)
+
+    def _configure_connection(self, connection):
+        """Size the prepared statement cache of a new pooled connection."""
+        connection.prepared_max = self.config.get('prepared_max', 100)
+
+    def get_connection(self):
+        """
+        Context manager for getting a pooled connection.
+        The connection is committed on success and rolled back on error.
+        """
+        return self.connection_pool.connection()
+
+    def release_connection(self):
+        """No-op: connections go back to the pool after every call."""
+        pass
+
+    def execute_query(self, query: str,
+                     params: Optional[Union[Dict[str, Any], Tuple[Any], List[Any]]] = None,
+                     fetch_as_dict: bool = False,
+                     timeout: Optional[int] = None) -> Any:
+        """
+        Execute a PostgreSQL query with enhanced error handling.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            fetch_as_dict: Whether to return results as dictionaries
+            timeout: Query timeout in seconds
+
+        Returns:
+            Query results or affected row count
+        """
+        start_time = time.time()
+
+        try:
+            with self.get_connection() as connection:
+                with connection.cursor(binary=True) as cursor:
+                    if timeout:
+                        # Scoped to the transaction the pool opens for this checkout; the
+                        # pipeline sends it together with the query instead of waiting for it
+                        with connection.pipeline():
+                            # On its own cursor, so this one holds the query's result
+                            connection.execute(f"SET LOCAL statement_timeout = {int(timeout * 1000)}")
+                            cursor.execute(query, params)
+                    else:
+                        cursor.execute(query, params)
+
+                    if cursor.description:  # SELECT query
+                        result = cursor.fetchall()
+                        if fetch_as_dict:
+                            columns = tuple(desc.name for desc in cursor.description)
+                            result = [dict(zip(columns, row)) for row in result]
+                    else:
+                        result = cursor.rowcount
+
+                    return result
+
+        except (OperationalError, DatabaseError) as err:
+            error_msg = f"""
+            PostgreSQL Error: {str(err)}
+            Query: {query}
+            Parameters: {params}
+            """
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+
+        finally:
+            elapsed_time = time.time() - start_time
+            if elapsed_time > self.config.get('long_query_threshold', 60):
+                logger.warning(f"Query took too long ({elapsed_time:.2f} seconds)")
+
+    def execute_batch_query(self, query: str, values: List[tuple], batch_size: int = 1000,
+                            template: Optional[str] = None):
+        """
+        Execute a parameterized query for every row in values.
+
+        psycopg 3 pipelines executemany into a single extended-protocol batch,
+        so the whole list is sent without a round trip per row.
+
+        Args:
+            query: SQL query with one row of %s placeholders, e.g. "INSERT INTO t (a, b) VALUES (%s, %s)"
+            values: List of parameter tuples
+            batch_size: Unused; accepted so callers can pass the same keywords as to PostgreSQLClient
+            template: Unused; accepted so callers can pass the same keywords as to PostgreSQLClient
+        """
+        try:
+            with self.get_connection() as connection:
+                with connection.cursor(binary=True) as cursor:
+                    cursor.executemany(query, values)
+                    logger.info(f"Processed {len(values)} records")
+
+        except (OperationalError, DatabaseError) as err:
+            error_msg = f"""
+            Batch Error: {str(err)}
+            Query: {query}
+            """
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+
+    def bulk_copy(self, table: str, columns: Sequence[str], rows):
+        """
+        Load rows into a table with COPY ... FROM STDIN.
+
+        Text format is used so that Python values don't have to match the exact
+        column types, which binary COPY would require.
+
+        Args:
+            table: Target table name
+            columns: Column names in row order
+            rows: Iterable of row tuples; consumed lazily
+        """
+        copy_query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(map(sql.Identifier, columns))
+        )
+
+        try:
+            with self.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    with cursor.copy(copy_query) as copy:
+                        count = 0
+                        for row in rows:
+                            copy.write_row(row)
+                            count += 1
+                    logger.info(f"Copied {count} records into {table}")
+                    return count
+
+        except (OperationalError, DatabaseError) as err:
+            error_msg = f"COPY into {table} failed: {str(err)}"
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+
+    def disconnect(self):
+        """Close all database connections."""
+        if self.connection_pool:
+            self.connection_pool.close()
+            self.connection_pool = None
+            logger.info("PostgreSQL Database disconnected successfully.")
@@ -1,22 +1,118 @@
 import psycopg2
-from psycopg2 import pool, OperationalError, DatabaseError
-from psycopg2.extras import DictCursor, execute_batch, execute_values
+from psycopg2 import errors, extensions, pool, sql, OperationalError, DatabaseError
+from psycopg2.extras import execute_batch, execute_values
 from .base_database import BaseDatabase, DatabaseConnectionError
+import collections
+import functools
+import itertools
 import logging
 import threading
 import json
 import queue
+import random
 import time
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
 # Create a queue to hold failed queries
 failed_query_queue = queue.Queue()
 MAX_RETRIES = 3
+FAILED_QUERIES_LOG = 'failed_queries.log'
+FAILED_QUERY_WINDOW = 60  # seconds over which repeats of a query are coalesced
+FAILED_QUERY_MAX_TRACKED = 1024
+# execute_values inlines rows into the statement text; cap values per statement
+MAX_BATCH_VALUES = 2_000_000
+# Conflicts that succeed when the whole transaction is simply run again
+RETRYABLE_TRANSACTION_ERRORS = (errors.DeadlockDetected, errors.SerializationFailure, errors.LockNotAvailable)
+TRANSACTION_RETRY_BASE_DELAY = 0.1  # seconds
+HEALTH_CHECK_IDLE = 30  # seconds a connection may sit unused before it is pinged
 
 logger = logging.getLogger(__name__)
 
+_cursor_ids = itertools.count(1)
+_failed_query_writer = None
+_failed_query_writer_lock = threading.Lock()
+
+
+def _drain_failed_queue():
+    """
+    Consume failed_query_queue and append each entry to the failed queries log.
+
+    Repeats of a query already logged in the current window are only counted,
+    and written as a single summary line when the window closes.
+    """
+    seen = set()
+    repeats = collections.Counter()
+    window_start = time.monotonic()
+    # Opened on the first failure, so processes without any leave no log file behind
+    f = None
+
+    while True:
+        try:
+            failed_query = failed_query_queue.get(timeout=FAILED_QUERY_WINDOW)
+        except queue.Empty:
+            failed_query = None
+
+        # Any error is logged and the loop carries on; a dead writer would leave
+        # the unbounded queue growing for the rest of the process
+        try:
+            if time.monotonic() - window_start >= FAILED_QUERY_WINDOW:
+                window_repeats = list(repeats.items())
+                seen.clear()
+                repeats.clear()
+                window_start = time.monotonic()
+                # Repeats are only counted for queries already written, so the file is open
+                if f is not None:
+                    for query, count in window_repeats:
+                        f.write(json.dumps({'query': query, 'repeated': count,
+                                            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')}) + "\n")
+                    f.flush()
+
+            if failed_query is not None:
+                query, params, failed_at = failed_query
+                if query in seen:
+                    repeats[query] += 1
+                else:
+                    if f is None:
+                        f = open(FAILED_QUERIES_LOG, 'a', buffering=64 * 1024)
+                    f.write(json.dumps({
+                        'query': query,
+                        'params': params or {},
+                        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(failed_at)),
+                        'retry_count': 0
+                    }, default=str) + "\n")
+                    # Only once written, so later repeats have a line to refer to
+                    if len(seen) < FAILED_QUERY_MAX_TRACKED:
+                        seen.add(query)
+                # Only flush once the burst is drained
+                if f is not None and failed_query_queue.empty():
+                    f.flush()
+        except Exception as err:
+            logger.error(f"Failed to write failed query: {err}")
+        finally:
+            if failed_query is not None:
+                failed_query_queue.task_done()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(query: str) -> str:
+    """Replace each %s placeholder in query with $1, $2, ... in order."""
+    parts = query.split("%s")
+    return parts[0] + "".join(f"${i}{part}" for i, part in enumerate(parts[1:], start=1))
+
+
+def _start_failed_query_writer():
+    """Start the background failed query writer once per process."""
+    global _failed_query_writer
+    with _failed_query_writer_lock:
+        if _failed_query_writer is None or not _failed_query_writer.is_alive():
+            _failed_query_writer = threading.Thread(
+                target=_drain_failed_queue, name='failed-query-writer', daemon=True
+            )
+            _failed_query_writer.start()
+
+
 class PostgreSQLClient(BaseDatabase):
     """PostgreSQL database connection and operations with enhanced functionality."""
 
@@ -29,8 +125,10 @@ class PostgreSQLClient(BaseDatabase):
         """
         super().__init__(config)
         self._local = threading.local()
-        self._connection_lock = threading.Lock()
         self.connection_pool = None
+        self.batch_size = self.config.get('batch_size', 10000)
+        self._last_used = {}
+        _start_failed_query_writer()
 
     def connect(self):
         """
@@ -84,11 +182,21 @@ class PostgreSQLClient(BaseDatabase):
         Context manager for getting a connection with proper lifecycle management.
         """
         try:
-            with self._connection_lock:
-                if not hasattr(self._local, 'connection') or self._local.connection is None:
-                    self._local.connection = self.connection_pool.getconn()
+            # _local is per-thread, so no lock is needed here; the pool itself
+            # is thread-safe when handing out connections.
+            connection = getattr(self._local, 'connection', None)
+            if connection is not None and not self._is_alive(connection):
+                self._discard_connection(connection)
+                connection = None
+            if connection is None:
+                connection = self.connection_pool.getconn()
+                if not self._is_alive(connection):
+                    self._discard_connection(connection)
+                    connection = self.connection_pool.getconn()
+                self._local.connection = connection
 
-            yield self._local.connection
+            yield connection
+            self._last_used[id(connection)] = time.monotonic()
 
         except Exception as e:
             if hasattr(self._local, 'connection') and self._local.connection:
@@ -101,6 +209,67 @@ class PostgreSQLClient(BaseDatabase):
                     self._local.connection = None
             raise e
 
+    def _is_alive(self, connection) -> bool:
+        """
+        Check that a connection is still usable.
+
+        Connections used within the last HEALTH_CHECK_IDLE seconds (config
+        'health_check_idle') or not yet used by this client are trusted; older
+        ones are pinged with SELECT 1.
+        """
+        if connection.closed:
+            return False
+        last_used = self._last_used.get(id(connection))
+        if last_used is None or time.monotonic() - last_used <= self.config.get('health_check_idle', HEALTH_CHECK_IDLE):
+            return True
+        try:
+            was_idle = connection.info.transaction_status == extensions.TRANSACTION_STATUS_IDLE
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if was_idle:
+                # End the transaction the ping opened instead of leaving the connection idle in it
+                connection.rollback()
+            self._last_used[id(connection)] = time.monotonic()
+            return True
+        except (OperationalError, DatabaseError) as err:
+            logger.warning(f"Dropping dead pooled connection: {err}")
+            return False
+
+    def _discard_connection(self, connection):
+        """Close a broken connection and remove it from the pool."""
+        self._last_used.pop(id(connection), None)
+        if getattr(self._local, 'connection', None) is connection:
+            self._local.connection = None
+        try:
+            self.connection_pool.putconn(connection, close=True)
+        except:
+            pass
+
+    def release_connection(self):
+        """Return the calling thread's connection to the pool, e.g. before a worker thread exits."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            self._local.connection = None
+            try:
+                self.connection_pool.putconn(connection)
+            except:
+                pass
+
+    def as_string(self, query: Union[str, sql.Composable]) -> str:
+        """
+        Render a psycopg2.sql composition to query text.
+
+        Args:
+            query: A plain query string or a psycopg2.sql composable
+
+        Returns:
+            The query text
+        """
+        if isinstance(query, str):
+            return query
+        with self.get_connection() as connection:
+            return query.as_string(connection)
+
     def _format_query_and_params(self, query: str,
                                 params: Optional[Union[Dict[str, Any], Tuple[Any], List[Any]]] = None) -> Tuple[str, Any]:
         """
@@ -124,12 +293,7 @@ class PostgreSQLClient(BaseDatabase):
                     remaining_params = {k: v for k, v in params.items() if k != 'tableDate'}
                     formatted_params = tuple(remaining_params.values()) if remaining_params else None
                     return formatted_query, formatted_params
-                param_count = 1
-                formatted_query = query
-                while "%s" in formatted_query:
-                    formatted_query = formatted_query.replace("%s", f"${param_count}", 1)
-                    param_count += 1
-                return formatted_query, tuple(params.values())
+                return _compile_template(query), tuple(params.values())
 
             return query, params
 
@@ -159,18 +323,28 @@ class PostgreSQLClient(BaseDatabase):
             formatted_query, formatted_params = self._format_query_and_params(query, params)
 
             with self.get_connection() as connection:
-                cursor_factory = DictCursor if fetch_as_dict else None
-                with connection.cursor(cursor_factory=cursor_factory) as cursor:
+                # Plain tuple rows are cheaper to build than DictRow; dicts are
+                # assembled below in a single pass when requested
+                with connection.cursor() as cursor:
                     if timeout:
-                        cursor.execute(f"SET statement_timeout = {timeout * 1000}")
-
-                    cursor.execute(formatted_query, formatted_params or ())
+                        # Send the override in the same message as the query; SET LOCAL
+                        # keeps it from leaking onto the pooled connection
+                        cursor.execute(
+                            f"SET LOCAL statement_timeout = {int(timeout * 1000)}; {formatted_query}",
+                            formatted_params or ()
+                        )
+                    else:
+                        cursor.execute(formatted_query, formatted_params or ())
 
                     if cursor.description:  # SELECT query
                         result = cursor.fetchall()
                         if fetch_as_dict:
-                            columns = [desc[0] for desc in cursor.description]
+                            columns = tuple(desc[0] for desc in cursor.description)
                             result = [dict(zip(columns, row)) for row in result]
+                        if timeout or not cursor.statusmessage.startswith('SELECT'):
+                            # End the transaction so the SET LOCAL override is dropped,
+                            # and so INSERT/UPDATE/DELETE ... RETURNING is persisted
+                            connection.commit()
                     else:
                         result = cursor.rowcount
                         connection.commit()
@@ -192,20 +366,76 @@ class PostgreSQLClient(BaseDatabase):
             if elapsed_time > self.config.get('long_query_threshold', 60):
                 logger.warning(f"Query took too long ({elapsed_time:.2f} seconds)")
 
-    def execute_batch_query(self, query: str, values: List[tuple], batch_size: int = 1000):
+    def execute_query_iter(self, query: str,
+                           params: Optional[Union[Dict[str, Any], Tuple[Any], List[Any]]] = None,
+                           itersize: int = 10000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a SELECT on a server-side (named) cursor and stream the results.
+
+        Only itersize rows are held in memory at a time. The cursor lives on a
+        pooled connection of its own, so queries and commits on this thread's
+        connection while iterating don't invalidate it.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            itersize: Number of rows fetched per round trip
+
+        Yields:
+            Lists of up to itersize rows as dictionaries
+        """
+        formatted_query, formatted_params = self._format_query_and_params(query, params)
+
+        try:
+            # The pool rolls back a connection handed back mid-transaction, e.g. when
+            # the caller stops iterating early
+            with self._get_new_connection() as connection:
+                with connection.cursor(name=f"etl_read_{next(_cursor_ids)}") as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(formatted_query, formatted_params or ())
+
+                    columns = None
+                    while True:
+                        rows = cursor.fetchmany(itersize)
+                        if not rows:
+                            break
+                        if columns is None:
+                            columns = tuple(desc[0] for desc in cursor.description)
+                        yield [dict(zip(columns, row)) for row in rows]
+
+                # Close the transaction the named cursor lived in
+                connection.commit()
+
+        except (OperationalError, DatabaseError) as err:
+            error_msg = f"""
+            PostgreSQL Error: {str(err)}
+            Query: {formatted_query}
+            Parameters: {formatted_params}
+            """
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+
+    def execute_batch_query(self, query: str, values: List[tuple], batch_size: Optional[int] = None,
+                            template: Optional[str] = None):
         """
         Execute a batch of PostgreSQL queries with improved performance.
 
         Args:
             query: SQL query to execute
             values: List of parameter tuples
-            batch_size: Size of each batch
+            batch_size: Rows per INSERT statement; defaults to config['batch_size'] (10000),
+                lowered for wide rows so no statement carries more than MAX_BATCH_VALUES values
+            template: Optional row template for execute_values, e.g. "(%s::integer, %s::text)"
         """
+        if not values:
+            return
+        batch_size = max(1, min(batch_size or self.batch_size, MAX_BATCH_VALUES // max(1, len(values[0]))))
+
         with self.get_connection() as connection:
             try:
                 with connection.cursor() as cursor:
                     # Use execute_values for better performance
-                    execute_values(cursor, query, values, page_size=batch_size)
+                    execute_values(cursor, query, values, template=template or None, page_size=batch_size)
                     connection.commit()
                     logger.info(f"Processed {len(values)} records in batches of {batch_size}")
 
@@ -219,29 +449,83 @@ class PostgreSQLClient(BaseDatabase):
                 connection.rollback()
                 raise DatabaseConnectionError(error_msg)
 
-    def execute_transaction(self, queries: List[tuple]):
+    def execute_copy(self, query: str, file: IO):
         """
-        Execute multiple queries as a transaction.
+        Stream data into the database with COPY ... FROM STDIN.
 
         Args:
-            queries: List of (query, params) tuples
+            query: COPY statement reading FROM STDIN
+            file: File-like object holding the data in the format the statement expects
         """
         with self.get_connection() as connection:
             try:
                 with connection.cursor() as cursor:
-                    for query, params in queries:
-                        formatted_query, formatted_params = self._format_query_and_params(query, params)
-                        cursor.execute(formatted_query, formatted_params or ())
-
-                connection.commit()
-                logger.info("Transaction executed successfully.")
+                    cursor.copy_expert(query, file)
+                    connection.commit()
+                    return cursor.rowcount
 
             except (OperationalError, DatabaseError) as err:
-                error_msg = f"Transaction failed: {str(err)}"
+                error_msg = f"""
+                Copy Error: {str(err)}
+                Query: {query}
+                """
                 logger.error(error_msg)
                 connection.rollback()
                 raise DatabaseConnectionError(error_msg)
 
+    def execute_transaction(self, queries: List[tuple]):
+        """
+        Execute multiple queries as a transaction.
+
+        Deadlocks, serialization failures and lock timeouts roll back and rerun the
+        transaction up to MAX_RETRIES times with jittered exponential backoff; any
+        other error is raised immediately.
+
+        Args:
+            queries: List of (query, params) tuples
+        """
+        # Group contiguous runs of the same statement so they can be
+        # sent with execute_batch instead of one round trip each
+        runs = []
+        for query, params in queries:
+            formatted_query, formatted_params = self._format_query_and_params(query, params)
+            if runs and runs[-1][0] == formatted_query:
+                runs[-1][1].append(formatted_params or ())
+            else:
+                runs.append((formatted_query, [formatted_params or ()]))
+
+        for attempt in range(MAX_RETRIES + 1):
+            with self.get_connection() as connection:
+                try:
+                    with connection.cursor() as cursor:
+                        for formatted_query, params_list in runs:
+                            if len(params_list) > 1:
+                                execute_batch(cursor, formatted_query, params_list, page_size=500)
+                            else:
+                                cursor.execute(formatted_query, params_list[0])
+
+                    connection.commit()
+                    logger.info("Transaction executed successfully.")
+                    return
+
+                except RETRYABLE_TRANSACTION_ERRORS as err:
+                    connection.rollback()
+                    if attempt == MAX_RETRIES:
+                        error_msg = f"Transaction failed after {MAX_RETRIES} retries: {str(err)}"
+                        logger.error(error_msg)
+                        raise DatabaseConnectionError(error_msg)
+                    base = TRANSACTION_RETRY_BASE_DELAY
+                    delay = base * 2 ** attempt + random.uniform(0, base)
+                    logger.warning(f"Transaction conflict ({err.pgcode}), retrying in {delay:.2f} seconds")
+
+                except (OperationalError, DatabaseError) as err:
+                    error_msg = f"Transaction failed: {str(err)}"
+                    logger.error(error_msg)
+                    connection.rollback()
+                    raise DatabaseConnectionError(error_msg)
+
+            time.sleep(delay)
+
     def execute_query_with_savepoint(self, query: str, params: Optional[Dict[str, Any]] = None):
         """
         Execute a query with a savepoint for better transaction control.
@@ -269,19 +553,18 @@ class PostgreSQLClient(BaseDatabase):
                 raise DatabaseConnectionError(error_msg)
 
     def log_failed_query(self, query: str, params: Optional[Dict[str, Any]] = None):
-        """Log failed queries for retry attempts."""
+        """
+        Log failed queries for retry attempts.
+
+        The raw (query, params, time) entry is handed to the background writer
+        without blocking; serialization happens on the writer thread.
+        """
         try:
-            failed_query_data = {
-                'query': query,
-                'params': json.dumps(params or {}),
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'retry_count': 0
-            }
-            failed_query_queue.put(failed_query_data)
+            failed_query_queue.put_nowait((query, params, time.time()))
             logger.info("Failed query logged for retry.")
         except Exception as err:
             logger.error(f"Failed to log failed query: {err}")
-            with open('failed_queries.log', 'a') as f:
+            with open(FAILED_QUERIES_LOG, 'a') as f:
                 f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {query} | {params}\n")
 
     def disconnect(self):
@@ -1,26 +1,65 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import date, datetime
 from tqdm import tqdm
 from helpers.utils import retry
+from psycopg2 import sql
+from psycopg2.extensions import register_adapter
+from psycopg2.extras import Json
+from .copy_format import COPY_NULL, copy_value, dumps_json
+import csv
+import functools
+import io
+import itertools
 import re
-import json
+import time
 
 logger = logging.getLogger(__name__)
 
+TYPE_INFERENCE_SAMPLE_SIZE = 50
+_NUMERIC_TYPES = (int, float)
+PROGRESS_POSTFIX_EVERY = 50  # batches between progress bar postfix updates
+QUERY_CACHE_SIZE = 1024
+_TABLE_NAME_RE = re.compile(r'[A-Za-z][A-Za-z0-9_]*')
+
+
+# Let plain dict parameters go to json/jsonb columns; lists keep adapting to ARRAY
+register_adapter(dict, lambda value: Json(value, dumps=dumps_json))
+
 class PostgresqlGenericCRUD:
     """Generic CRUD operations for any table in PostgreSQL with enhanced functionality."""
 
-    def __init__(self, db_client):
+    def __init__(self, db_client, cache_ttl: float = 60):
         """
         Initialize the PostgresqlGenericCRUD class.
 
         Args:
             db_client: An instance of PostgreSQLClient
+            cache_ttl (float): Seconds to reuse table metadata lookups before querying again.
+
+        Raises:
+            TypeError: If db_client lacks the psycopg2 client methods used here,
+                e.g. a PostgreSQL3Client.
         """
+        missing = [name for name in ('as_string', 'execute_copy', 'execute_query_iter')
+                   if not hasattr(db_client, name)]
+        if missing:
+            raise TypeError(
+                f"PostgresqlGenericCRUD requires a PostgreSQLClient (psycopg2); "
+                f"{type(db_client).__name__} has no {', '.join(missing)}"
+            )
         self.db_client = db_client
-
-    def _validate_table_name(self, table_name: str) -> bool:
+        self.cache_ttl = cache_ttl
+        self._columns_cache = {}
+        self._exists_cache = {}
+        self._insert_template_cache = {}
+        self._plain_table_cache = {}
+        self._query_cache = {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _validate_table_name(table_name: str) -> bool:
         """
         Validate table name against SQL injection and naming rules.
 
@@ -30,8 +69,50 @@ class PostgresqlGenericCRUD:
         Returns:
             bool: True if valid, False otherwise.
         """
-        pattern = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
-        return bool(pattern.match(table_name))
+        return bool(_TABLE_NAME_RE.fullmatch(table_name))
+
+    @staticmethod
+    def _identifier(name: str, exact: bool = False) -> sql.Identifier:
+        """
+        Quote a table or column name.
+
+        A caller-supplied name is lower-cased first so it resolves exactly like
+        the unquoted name did, while reserved words and special characters are
+        escaped. Names read back from the catalog are already exact.
+
+        Args:
+            name (str): The table or column name.
+            exact (bool): Quote the name as it is, e.g. a mixed-case catalog name.
+
+        Returns:
+            sql.Identifier: The quoted identifier.
+        """
+        return sql.Identifier(name if exact else name.lower())
+
+    def _column_list(self, columns: List[str], exact: bool = False) -> sql.Composed:
+        """Build a comma separated list of quoted column names."""
+        return sql.SQL(", ").join(self._identifier(column, exact) for column in columns)
+
+    def _cached_query(self, key: Tuple[Any, ...], build: Callable[[], sql.Composable]) -> str:
+        """
+        Return rendered query text for key, composing it with build() only on a miss.
+
+        Identical calls then reuse the exact same statement text, which also lets
+        the server reuse its plan for prepared statements.
+
+        Args:
+            key (tuple): Everything the query text depends on.
+            build (callable): Returns the sql.Composable to render.
+
+        Returns:
+            str: The query text.
+        """
+        query = self._query_cache.get(key)
+        if query is None:
+            if len(self._query_cache) >= QUERY_CACHE_SIZE:
+                self._query_cache.clear()
+            query = self._query_cache[key] = self.db_client.as_string(build())
+        return query
 
     def _get_table_columns(self, table: str, show_id: bool = False) -> List[str]:
         """
@@ -44,6 +125,11 @@ class PostgresqlGenericCRUD:
         Returns:
             list: List of column names.
         """
+        key = (table, show_id)
+        cached = self._columns_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+
         query = """
         SELECT column_name, data_type, character_maximum_length,
                is_nullable, column_default, is_identity
@@ -56,32 +142,243 @@ class PostgresqlGenericCRUD:
 
         try:
             result = self.db_client.execute_query(query, (table,), fetch_as_dict=True)
-            return [row['column_name'] for row in result]
+            columns = [row['column_name'] for row in result]
+            self._columns_cache[key] = (time.monotonic() + self.cache_ttl, columns)
+            return list(columns)
         except Exception as e:
             logger.error(f"Failed to get table columns: {e}")
             raise
 
-    def _format_dates(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _invalidate_table_cache(self, table: str) -> None:
+        """
+        Drop cached metadata for a table so the next lookup hits the database.
+
+        Args:
+            table (str): The table name.
+        """
+        self._exists_cache.pop(table, None)
+        self._columns_cache.pop((table, True), None)
+        self._columns_cache.pop((table, False), None)
+        self._plain_table_cache.pop(table, None)
+        for key in [k for k in self._insert_template_cache if k[0] == table]:
+            del self._insert_template_cache[key]
+
+    def _get_insert_plan(self, table: str, columns: List[str]) -> Tuple[Optional[str], Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Build an execute_values row template with explicit casts to the table's column types.
+
+        Args:
+            table (str): The table name.
+            columns (list): Column names in insert order.
+
+        Returns:
+            tuple: (template such as "(%s::integer, %s::text)" or None if unavailable,
+                positions of json/jsonb columns whose values must be serialized,
+                positions of array columns)
         """
-        Format date fields in a record with timezone handling.
+        key = (table, tuple(columns))
+        if key in self._insert_template_cache:
+            return self._insert_template_cache[key]
+
+        query = """
+        SELECT attname, format_type(atttypid, NULL), atttypmod
+        FROM pg_attribute
+        WHERE attrelid = to_regclass(%s) AND attnum > 0 AND NOT attisdropped
+        """
+        try:
+            result = self.db_client.execute_query(query, (table,))
+        except Exception as e:
+            logger.warning(f"Could not build insert template for '{table}': {e}")
+            return None, (), ()
+
+        column_types = {name: (data_type, typmod) for name, data_type, typmod in result}
+        placeholders = []
+        json_positions = []
+        array_positions = []
+        for position, column in enumerate(columns):
+            data_type, typmod = column_types.get(column) or column_types.get(column.lower()) or (None, -1)
+            if data_type in ('json', 'jsonb'):
+                json_positions.append(position)
+            elif data_type is not None and data_type.endswith('[]'):
+                array_positions.append(position)
+            # Columns with a modifier such as char(5) or varchar(4) are left to the
+            # assignment cast: casting to the bare type would mean char(1), and an
+            # explicit cast to the full type silently truncates over-long values
+            if data_type is None or typmod != -1:
+                placeholders.append("%s")
+            else:
+                placeholders.append(f"%s::{data_type}")
+        template = f"({', '.join(placeholders)})"
+
+        plan = (template, tuple(json_positions), tuple(array_positions))
+        self._insert_template_cache[key] = plan
+        return plan
+
+    @staticmethod
+    def _retry(func: Callable) -> Callable:
+        """Wrap func with the retry policy of the CRUD operations."""
+        return retry(max_retries=5, delay=5, backoff=2, exceptions=(Exception,), logger=logger)(func)
+
+    @staticmethod
+    def _check_row_width(rows: List[Tuple[Any]], ncols: int) -> None:
+        """Raise ValueError if any row does not have exactly ncols values."""
+        bad = next((t for t in rows if len(t) != ncols), None)
+        if bad is not None:
+            raise ValueError(f"Number of values {len(bad)} does not match number of columns {ncols}")
+
+    def _lookup_relation(self, table: str) -> Optional[str]:
+        """
+        Look up a relation once and fill both the existence and plain-table caches.
 
         Args:
-            record (dict): The record with potential date fields.
+            table (str): The table name.
 
         Returns:
-            dict: The record with formatted date fields.
+            Optional[str]: The pg_class relkind, or None if no such relation exists.
+        """
+        # to_regclass resolves through the search_path only, instead of
+        # scanning information_schema across every schema
+        query = "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)"
+        result = self.db_client.execute_query(query, (table,))
+        relkind = result[0][0] if result else None
+        self._exists_cache[table] = (time.monotonic() + self.cache_ttl, relkind is not None)
+        self._plain_table_cache[table] = relkind in ('r', 'p')
+        return relkind
+
+    def _is_plain_table(self, table: str) -> bool:
+        """
+        Check whether a relation is an ordinary or partitioned table, i.e. a valid COPY target.
+
+        Args:
+            table (str): The table name.
+
+        Returns:
+            bool: True if rows can be loaded with COPY, False for views and other relations.
+        """
+        if table not in self._plain_table_cache:
+            self._lookup_relation(table)
+        return self._plain_table_cache[table]
+
+    @staticmethod
+    def _array_literal(values: Iterable[Any]) -> str:
+        """Render a (nested) list as a PostgreSQL array literal, e.g. {"a","b",NULL}."""
+        items = []
+        for value in values:
+            if value is None:
+                items.append('NULL')
+            elif isinstance(value, (list, tuple)):
+                items.append(PostgresqlGenericCRUD._array_literal(value))
+            else:
+                text = str(copy_value(value))
+                items.append('"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"')
+        return '{' + ','.join(items) + '}'
+
+    @staticmethod
+    def _serialize_array_columns(row: Tuple[Any], array_positions: Tuple[int, ...]) -> Tuple[Any]:
+        """Render list values at array_positions as PostgreSQL array literals."""
+        row = list(row)
+        for position in array_positions:
+            value = row[position]
+            if isinstance(value, (list, tuple)):
+                row[position] = PostgresqlGenericCRUD._array_literal(value)
+        return tuple(row)
+
+    @staticmethod
+    def _serialize_json_columns(row: Tuple[Any], json_positions: Tuple[int, ...]) -> Tuple[Any]:
+        """Serialize dict/list values at json_positions to JSON text."""
+        row = list(row)
+        for position in json_positions:
+            value = row[position]
+            if isinstance(value, (dict, list)):
+                row[position] = dumps_json(value)
+        return tuple(row)
+
+    @staticmethod
+    def _is_numeric_sample(rows: List[Tuple[Any]]) -> bool:
+        """Check whether every value in the type-inference sample is an int or float (bool excluded)."""
+        sample = rows[:TYPE_INFERENCE_SAMPLE_SIZE]
+        return bool(sample) and all(type(v) in _NUMERIC_TYPES for row in sample for v in row)
+
+    def _copy_batch(self, query: str, batch: List[Tuple[Any]], numeric: bool = False,
+                    array_positions: Tuple[int, ...] = ()) -> None:
         """
-        for key, value in record.items():
-            if isinstance(value, (date, datetime)):
-                record[key] = value.strftime('%Y-%m-%d %H:%M:%S') if isinstance(value, datetime) else value.strftime('%Y-%m-%d')
-        return record
+        Insert one batch of rows with COPY ... FROM STDIN in CSV format.
+
+        Args:
+            query (str): COPY statement, as built by create.
+            batch (list of tuples): Rows to insert.
+            numeric (bool): The payload is all ints/floats; rows without NULLs are
+                written as-is instead of converting every value.
+            array_positions (tuple): Positions of array columns, whose list values
+                are written as array literals rather than JSON.
+        """
+        buffer = io.StringIO()
+        # Strings are always quoted, so only the NULL marker is an unquoted \N
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+        if numeric and not any(None in row for row in batch):
+            writer.writerows(batch)
+        else:
+            if array_positions:
+                batch = [self._serialize_array_columns(row, array_positions) for row in batch]
+            writer.writerows([copy_value(v) for v in row] for row in batch)
+        buffer.seek(0)
+
+        self.db_client.execute_copy(query, buffer)
+
+    def _format_dates_bulk(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Format date fields across a whole result set.
+
+        Date and datetime columns are detected once from the first non-null value
+        of each column, so only those keys are visited for the remaining rows.
+
+        Args:
+            records (list of dict): Records sharing the same keys.
+
+        Returns:
+            list: The same records with formatted date fields.
+        """
+        if not records:
+            return records
+
+        datetime_keys = []
+        date_keys = []
+        pending = set(records[0])
+        for record in records:
+            for key in [k for k in pending if record[k] is not None]:
+                pending.discard(key)
+                value = record[key]
+                if isinstance(value, datetime):
+                    datetime_keys.append(key)
+                elif isinstance(value, date):
+                    date_keys.append(key)
+            if not pending:
+                break
+
+        if not datetime_keys and not date_keys:
+            return records
+
+        # isoformat is implemented in C; [:19] drops any UTC offset, matching '%Y-%m-%d %H:%M:%S'
+        isoformat_dt = datetime.isoformat
+        isoformat_d = date.isoformat
+        for record in records:
+            for key in datetime_keys:
+                value = record[key]
+                if value is not None:
+                    record[key] = isoformat_dt(value, ' ', 'seconds')[:19]
+            for key in date_keys:
+                value = record[key]
+                if value is not None:
+                    record[key] = isoformat_d(value)
+        return records
 
     def _infer_column_types(self, values: List[Tuple[Any]], columns: List[str], primary_key: str = None) -> Dict[str, str]:
         """
         Infer PostgreSQL-specific column types with improved type mapping.
 
         Args:
-            values (list of tuples): Sample data for type inference.
+            values (list of tuples): Sample data for type inference; only the first
+                TYPE_INFERENCE_SAMPLE_SIZE rows are inspected.
             columns (list): Column names.
             primary_key (str, optional): Primary key column name.
 
@@ -100,20 +397,20 @@ class PostgresqlGenericCRUD:
             list: "JSONB"
         }
 
+        # Pivot a sample of rows into columns once instead of scanning per column
+        sample_columns = list(zip(*values[:TYPE_INFERENCE_SAMPLE_SIZE])) or [()] * len(columns)
+        none_type = type(None)
+
         inferred_types = {}
-        for idx, column in enumerate(columns):
-            # Sample multiple rows for better type inference
-            sample_values = [row[idx] for row in values if row[idx] is not None]
-            if not sample_values:
+        for column, column_values in zip(columns, sample_columns):
+            value_types = set(map(type, column_values))
+            value_types.discard(none_type)
+            if not value_types:
                 inferred_types[column] = "TEXT"
                 continue
 
-            # Determine type based on all non-null values
-            python_type = type(sample_values[0])
-            for value in sample_values[1:]:
-                if type(value) != python_type:
-                    python_type = str  # Default to string for mixed types
-                    break
+            # Default to string for mixed types
+            python_type = value_types.pop() if len(value_types) == 1 else str
 
             sql_type = type_mapping.get(python_type, "TEXT")
 
@@ -138,45 +435,54 @@ class PostgresqlGenericCRUD:
         if not self._validate_table_name(table):
             raise ValueError(f"Invalid table name: {table}")
 
-        check_query = """
-        SELECT COUNT(*) AS table_exists
-        FROM information_schema.tables
-        WHERE table_name = %s
-        """
-
-        result = self.db_client.execute_query(check_query, (table,), fetch_as_dict=True)
-        if result[0]['table_exists'] > 0:
+        # Look the table up first: CREATE TABLE IF NOT EXISTS still needs CREATE
+        # on the schema, which roles that only insert into the table lack
+        if self.table_exists(table):
             logger.info(f"Table '{table}' already exists.")
             return
 
         try:
             column_types = self._infer_column_types(values, columns, primary_key)
-            columns_def = ", ".join([f"{col} {dtype}" for col, dtype in column_types.items()])
+            columns_def = sql.SQL(", ").join(
+                sql.SQL("{} {}").format(self._identifier(col), sql.SQL(dtype)) for col, dtype in column_types.items()
+            )
 
-            create_query = f"""
-            CREATE TABLE {table} (
-                {columns_def}
+            create_query = self.db_client.as_string(
+                sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(self._identifier(table), columns_def)
             )
-            """
 
             self.db_client.execute_query(create_query)
-            logger.info(f"Table '{table}' created successfully.")
+            self._invalidate_table_cache(table)
+            self._exists_cache[table] = (time.monotonic() + self.cache_ttl, True)
+            logger.info(f"Table '{table}' ensured to exist.")
 
         except Exception as e:
             logger.error(f"Failed to create table '{table}': {e}")
             raise
 
-    @retry(max_retries=5, delay=5, backoff=2, exceptions=(Exception,), logger=logger)
-    def create(self, table: str, values: List[Tuple[Any]], columns: List[str] = None, primary_key: str = None, batch_size: int = 1000) -> bool:
+    def create(self, table: str, values: Iterable[Tuple[Any]], columns: List[str] = None, primary_key: str = None,
+               batch_size: int = 1000, use_copy: bool = True, page_size: Optional[int] = None,
+               parallelism: int = 1) -> bool:
         """
         Create new records with progress bar visualization and batch processing information.
 
+        Each batch is retried on its own, so a transient error never re-reads a
+        partly consumed stream.
+
         Args:
             table (str): The table name.
-            values (list of tuples): Values to insert.
+            values (iterable of tuples): Values to insert. Lists are validated up front;
+                other iterables (e.g. generators) are streamed batch by batch.
             columns (list, optional): Column names.
             primary_key (str, optional): Primary key column name.
             batch_size (int): Size of each batch for processing.
+            use_copy (bool): Load batches with COPY FROM STDIN when the target is a plain table,
+                otherwise fall back to INSERT ... VALUES via execute_values.
+            page_size (int, optional): Rows per multi-row INSERT statement on the execute_values
+                path. Defaults to the whole batch, i.e. one round trip per batch.
+            parallelism (int): Number of batches loaded concurrently, each on its own pooled
+                connection; capped at the client's max_pool_size minus the caller's own
+                connection. Rows from different batches may land in any order when > 1.
 
         Returns:
             bool: True if successful, False otherwise.
@@ -185,51 +491,109 @@ class PostgresqlGenericCRUD:
         if not self._validate_table_name(table):
             raise ValueError(f"Invalid table name: {table}")
 
-        # Get table columns if not provided
-        if columns is None:
-            columns = self._get_table_columns(table)
+        # Get table columns if not provided; those are exact catalog names
+        exact_columns = columns is None
+        if exact_columns:
+            columns = self._retry(self._get_table_columns)(table)
 
         # Ensure values is properly formatted
-        if not isinstance(values, list):
+        if isinstance(values, tuple):
             values = [values]
-        values = [tuple(v) if not isinstance(v, tuple) else v for v in values]
+        total_rows = len(values) if isinstance(values, list) else None
+        rows = (v if isinstance(v, tuple) else tuple(v) for v in values)
+
+        # Validate data; a list is checked up front, a stream batch by batch
+        ncols = len(columns)
+        if total_rows is not None:
+            rows = list(rows)
+            self._check_row_width(rows, ncols)
 
-        # Validate data
-        for value_tuple in values:
-            if len(value_tuple) != len(columns):
-                raise ValueError(f"Number of values {len(value_tuple)} does not match number of columns {len(columns)}")
+        # Pull the first batch for type inference, then continue with the rest
+        row_iter = iter(rows)
+        first_batch = list(itertools.islice(row_iter, batch_size))
+        self._check_row_width(first_batch, ncols)
 
         # Create table if it doesn't exist
-        self.create_table_if_not_exists(table, columns, values, primary_key)
+        self._retry(self.create_table_if_not_exists)(table, columns, first_batch, primary_key)
+
+        # Every worker checks out its own connection, next to the one this thread holds
+        max_workers = max(1, self.db_client.config.get('max_pool_size', 10) - 1)
+        if parallelism > max_workers:
+            logger.warning(f"parallelism {parallelism} exceeds the connection pool; using {max_workers}")
+            parallelism = max_workers
 
         try:
-            # Prepare the insert query for execute_values
-            columns_str = ", ".join(columns)
-            query = f"INSERT INTO {table} ({columns_str}) VALUES %s"
+            columns_key = tuple(columns)
+            if use_copy and self._retry(self._is_plain_table)(table):
+                copy_query = self._cached_query(
+                    ('copy', table, columns_key, exact_columns),
+                    lambda: sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL {})").format(
+                        self._identifier(table), self._column_list(columns, exact_columns), sql.Literal(COPY_NULL)
+                    )
+                )
+
+                numeric = self._is_numeric_sample(first_batch)
+                _, _, array_positions = self._retry(self._get_insert_plan)(table, columns)
+
+                @self._retry
+                def insert_batch(batch):
+                    self._copy_batch(copy_query, batch, numeric, array_positions)
+            else:
+                # Prepare the insert query for execute_values
+                query = self._cached_query(
+                    ('insert', table, columns_key, exact_columns),
+                    lambda: sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+                        self._identifier(table), self._column_list(columns, exact_columns)
+                    )
+                )
+                template, json_positions, _ = self._retry(self._get_insert_plan)(table, columns)
+
+                @self._retry
+                def insert_batch(batch):
+                    if json_positions:
+                        batch = [self._serialize_json_columns(row, json_positions) for row in batch]
+                    self.db_client.execute_batch_query(query, batch, min(len(batch), page_size or len(batch)), template=template)
 
             # Calculate total batches and log the start of the process
-            total_batches = (len(values) - 1) // batch_size + 1
-            logger.info(f"Starting batch insert: {len(values)} records in {total_batches} batches")
+            total_batches = (total_rows - 1) // batch_size + 1 if total_rows is not None else None
+            if total_rows is not None:
+                logger.info(f"Starting batch insert: {total_rows} records in {total_batches} batches")
+            else:
+                logger.info(f"Starting batch insert from a stream in batches of {batch_size}")
+
+            def batches():
+                batch = first_batch
+                while batch:
+                    if total_rows is None and batch is not first_batch:
+                        self._check_row_width(batch, ncols)
+                    yield batch
+                    batch = list(itertools.islice(row_iter, batch_size))
 
             # Process the batches with a progress bar
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             with tqdm(total=total_batches, desc="Processing batches", unit="batch") as pbar:
-                for batch_num in range(total_batches):
-                    start_idx = batch_num * batch_size
-                    end_idx = min((batch_num + 1) * batch_size, len(values))
-                    batch = values[start_idx:end_idx]
-
-                    try:
-                        # execute_values expects a list of tuples for the values
-                        self.db_client.execute_batch_query(query, batch, batch_size)
-                        logger.debug(f"Batch {batch_num + 1}/{total_batches} completed: {len(batch)} records")
-                    except Exception as batch_error:
-                        logger.error(f"Error in batch {batch_num + 1}/{total_batches}: {batch_error}")
-                        raise
-
-                    pbar.set_postfix(records=end_idx, batch_size=len(batch))
-                    pbar.update(1)
-
-            logger.info(f"Successfully inserted {len(values)} records in {total_batches} batches")
+                if parallelism > 1:
+                    inserted, batch_num = self._insert_parallel(insert_batch, batches(), parallelism, pbar)
+                else:
+                    inserted = 0
+                    batch_num = 0
+                    for batch in batches():
+                        batch_num += 1
+                        try:
+                            insert_batch(batch)
+                            if debug_enabled:
+                                logger.debug(f"Batch {batch_num}/{total_batches or '?'} completed: {len(batch)} records")
+                        except Exception as batch_error:
+                            logger.error(f"Error in batch {batch_num}/{total_batches or '?'}: {batch_error}")
+                            raise
+
+                        inserted += len(batch)
+                        if batch_num % PROGRESS_POSTFIX_EVERY == 0:
+                            # refresh=False leaves redrawing to update(), which rate-limits itself
+                            pbar.set_postfix(records=inserted, batch_size=len(batch), refresh=False)
+                        pbar.update(1)
+
+            logger.info(f"Successfully inserted {inserted} records in {batch_num} batches")
             return True
 
         except Exception as e:
@@ -237,10 +601,67 @@ class PostgresqlGenericCRUD:
             return False
 
 
+    def _insert_parallel(self, insert_batch: Callable[[List[Tuple[Any]]], None],
+                         batches: Iterable[List[Tuple[Any]]], parallelism: int, pbar: tqdm) -> Tuple[int, int]:
+        """
+        Run insert_batch over batches on a thread pool.
+
+        At most 2 * parallelism batches are held in memory at a time, so streamed
+        input stays streamed.
+
+        Args:
+            insert_batch (callable): Loads one batch.
+            batches (iterable): Batches of row tuples.
+            parallelism (int): Number of worker threads.
+            pbar (tqdm): Progress bar to advance per finished batch.
+
+        Returns:
+            tuple: (records inserted, batches inserted)
+        """
+        def run(batch):
+            try:
+                insert_batch(batch)
+                return len(batch)
+            finally:
+                # Each worker thread holds its own pooled connection; hand it back
+                self.db_client.release_connection()
+
+        inserted = 0
+        batch_num = 0
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            pending = set()
+
+            def collect(futures):
+                nonlocal inserted, batch_num
+                for future in futures:
+                    try:
+                        inserted += future.result()
+                    except Exception as batch_error:
+                        logger.error(f"Error in parallel batch: {batch_error}")
+                        raise
+                    batch_num += 1
+                    pbar.update(1)
+
+            try:
+                for batch in batches:
+                    pending.add(executor.submit(run, batch))
+                    if len(pending) >= 2 * parallelism:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                collect(as_completed(pending))
+            except Exception:
+                # Stop batches that haven't started; the ones already running still finish
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return inserted, batch_num
+
     @retry(max_retries=5, delay=5, backoff=2, exceptions=(Exception,), logger=logger)
     def read(self, table: str, columns: List[str] = None, where: str = "",
              params: Tuple[Any] = None, show_id: bool = False,
-             batch_size: Optional[int] = None, order_by: str = None) -> List[Dict[str, Any]]:
+             batch_size: Optional[int] = None, order_by: str = None,
+             key_column: Optional[str] = None, last_key: Any = None) -> List[Dict[str, Any]]:
         """
         Read records with improved filtering and pagination.
 
@@ -252,40 +673,91 @@ class PostgresqlGenericCRUD:
             show_id (bool, optional): Include ID column.
             batch_size (int, optional): Number of records per batch.
             order_by (str, optional): ORDER BY clause.
+            key_column (str, optional): Page by this column (keyset pagination); see read_iter.
+            last_key (optional): key_column value of the last record of the previous page.
 
         Returns:
             list: List of records as dictionaries.
         """
+        try:
+            records = list(self.read_iter(table, columns, where, params, show_id, batch_size, order_by,
+                                          key_column=key_column, last_key=last_key))
+            logger.info(f"Retrieved {len(records)} records")
+            return records
+        except Exception as e:
+            logger.error(f"Failed to read records: {e}")
+            raise
+
+    def read_iter(self, table: str, columns: List[str] = None, where: str = "",
+                  params: Tuple[Any] = None, show_id: bool = False,
+                  batch_size: Optional[int] = None, order_by: str = None,
+                  itersize: int = 10000, key_column: Optional[str] = None,
+                  last_key: Any = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a server-side cursor instead of loading the full result.
+
+        With key_column set, records are ordered by that column and, when last_key
+        is given, start after it. Paging with batch_size and the key of the last
+        record returned then seeks through the index instead of rescanning the
+        skipped rows; include key_column in columns to read it back.
+
+        Args:
+            table (str): The table name.
+            columns (list, optional): Column names to retrieve; plain names, not expressions.
+            where (str, optional): WHERE clause.
+            params (tuple, optional): Query parameters.
+            show_id (bool, optional): Include ID column.
+            batch_size (int, optional): Number of records per batch.
+            order_by (str, optional): ORDER BY clause; not allowed together with key_column.
+            itersize (int): Rows fetched from the server per round trip.
+            key_column (str, optional): Unique, indexed column to page by.
+            last_key (optional): key_column value of the last record of the previous page.
+
+        Yields:
+            dict: One record at a time, with formatted date fields.
+        """
         if not self._validate_table_name(table):
             raise ValueError(f"Invalid table name: {table}")
 
-        if columns is None:
+        if key_column and order_by:
+            raise ValueError("order_by cannot be combined with key_column")
+
+        exact_columns = columns is None
+        if exact_columns:
             columns = self._get_table_columns(table, show_id=show_id)
 
-        columns_str = ", ".join(columns)
-        query = f"SELECT {columns_str} FROM {table}"
+        seek = bool(key_column) and last_key is not None
+        if seek:
+            params = tuple(params or ()) + (last_key,)
 
-        if where:
-            query += f" WHERE {where}"
+        def build():
+            query = sql.SQL("SELECT {} FROM {}").format(self._column_list(columns, exact_columns),
+                                                        self._identifier(table))
 
-        if order_by:
-            query += f" ORDER BY {order_by}"
+            conditions = [sql.SQL("({})").format(sql.SQL(where))] if where else []
+            if seek:
+                conditions.append(sql.SQL("{} > %s").format(self._identifier(key_column)))
+            if conditions:
+                query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
 
-        if batch_size:
-            query += f" LIMIT {batch_size}"
+            if key_column:
+                query += sql.SQL(" ORDER BY {}").format(self._identifier(key_column))
+            elif order_by:
+                query += sql.SQL(" ORDER BY ") + sql.SQL(order_by)
 
-        try:
-            result = self.db_client.execute_query(query, params, fetch_as_dict=True)
-            records = [self._format_dates(record) for record in result]
-            logger.info(f"Retrieved {len(records)} records")
-            return records
-        except Exception as e:
-            logger.error(f"Failed to read records: {e}")
-            raise
+            if batch_size:
+                query += sql.SQL(" LIMIT {}").format(sql.Literal(int(batch_size)))
+            return query
+
+        query = self._cached_query(('select', table, tuple(columns), exact_columns, where, order_by, batch_size,
+                                    key_column, seek), build)
+        for chunk in self.db_client.execute_query_iter(query, params, itersize=itersize):
+            yield from self._format_dates_bulk(chunk)
 
     @retry(max_retries=5, delay=5, backoff=2, exceptions=(Exception,), logger=logger)
     def update(self, table: str, updates: Dict[str, Any], where: str,
-              params: Tuple[Any], batch_size: Optional[int] = None) -> bool:
+              params: Tuple[Any], batch_size: Optional[int] = None,
+              return_updated: bool = False) -> Union[bool, List[Dict[str, Any]]]:
         """
         Update records with improved batching and validation.
 
@@ -295,22 +767,39 @@ class PostgresqlGenericCRUD:
             where (str): WHERE clause.
             params (tuple): Query parameters.
             batch_size (int, optional): Batch size for large updates.
+            return_updated (bool): Return the updated rows (UPDATE ... RETURNING *)
+                instead of reading them back with a second query.
 
         Returns:
-            bool: True if successful, False otherwise.
+            bool or list: True if successful, False otherwise; with return_updated,
+                the updated records as dictionaries on success.
         """
         if not self._validate_table_name(table):
             raise ValueError(f"Invalid table name: {table}")
 
-        set_clause = ", ".join([f"{col} = %s" for col in updates.keys()])
-        query = f"UPDATE {table} SET {set_clause} WHERE {where}"
+        def build():
+            set_clause = sql.SQL(", ").join(
+                sql.SQL("{} = %s").format(self._identifier(col)) for col in updates.keys()
+            )
+            query = sql.SQL("UPDATE {} SET {} WHERE ").format(self._identifier(table), set_clause) + sql.SQL(where)
+
+            if batch_size:
+                query += sql.SQL(" LIMIT {}").format(sql.Literal(int(batch_size)))
+
+            if return_updated:
+                query += sql.SQL(" RETURNING *")
+            return query
 
-        if batch_size:
-            query += f" LIMIT {batch_size}"
+        query = self._cached_query(('update', table, tuple(updates), where, batch_size, return_updated), build)
 
         values = tuple(updates.values()) + params
 
         try:
+            if return_updated:
+                records = self.db_client.execute_query(query, values, fetch_as_dict=True)
+                logger.info(f"Updated {len(records)} records")
+                return self._format_dates_bulk(records)
+
             affected_rows = self.db_client.execute_query(query, values)
             logger.info(f"Updated {affected_rows} records")
             return True
@@ -324,6 +813,9 @@ class PostgresqlGenericCRUD:
         """
         Delete records with improved safety and batching.
 
+        With batch_size, matching rows are deleted batch_size at a time, each batch
+        in its own transaction, until none are left.
+
         Args:
             table (str): The table name.
             where (str, optional): WHERE clause.
@@ -340,15 +832,27 @@ class PostgresqlGenericCRUD:
         if safe_delete and not where:
             raise ValueError("WHERE clause required for safe delete operation")
 
-        query = f"DELETE FROM {table}"
-        if where:
-            query += f" WHERE {where}"
+        def build():
+            table_sql = self._identifier(table)
+            where_sql = sql.SQL(" WHERE ") + sql.SQL(where) if where else sql.SQL("")
+            if not batch_size:
+                return sql.SQL("DELETE FROM {}").format(table_sql) + where_sql
 
-        if batch_size:
-            query += f" LIMIT {batch_size}"
+            # DELETE has no LIMIT; pick one batch of physical row ids instead
+            return sql.SQL(
+                "DELETE FROM {} WHERE (tableoid, ctid) IN (SELECT tableoid, ctid FROM {}{} LIMIT {})"
+            ).format(table_sql, table_sql, where_sql, sql.Literal(int(batch_size)))
+
+        query = self._cached_query(('delete', table, where, batch_size), build)
 
         try:
             affected_rows = self.db_client.execute_query(query, params)
+            if batch_size:
+                total = affected_rows
+                while affected_rows >= batch_size:
+                    affected_rows = self.db_client.execute_query(query, params)
+                    total += affected_rows
+                affected_rows = total
             logger.info(f"Deleted {affected_rows} records")
             return True
         except Exception as e:
@@ -373,7 +877,7 @@ class PostgresqlGenericCRUD:
             result = self.db_client.execute_query(query, params, fetch_as_dict=fetch_as_dict)
 
             if is_select and fetch_as_dict:
-                return [self._format_dates(record) for record in result]
+                return self._format_dates_bulk(result)
             return result
         except Exception as e:
             logger.error(f"Failed to execute raw query: {e}")
@@ -389,14 +893,12 @@ class PostgresqlGenericCRUD:
         Returns:
             bool: True if table exists, False otherwise.
         """
-        query = """
-        SELECT COUNT(*) AS table_exists
-        FROM information_schema.tables
-        WHERE table_name = %s
-        """
+        cached = self._exists_cache.get(table)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            result = self.db_client.execute_query(query, (table,), fetch_as_dict=True)
-            return result[0]['table_exists'] > 0
+            return self._lookup_relation(table) is not None
         except Exception as e:
             logger.error(f"Failed to check table existence: {e}")
             raise
@@ -4,19 +4,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Connection-level tuning applied at connect time; override through config['pragmas']
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -131072,  # 128 MiB
+}
+
 class SQLiteClient(BaseDatabase):
     """SQLite database connection and operations."""
 
+    # Set by begin(), cleared by commit() and rollback()
+    _in_transaction = False
+
     def connect(self):
         """Establish the SQLite database connection and create table if it doesn't exist."""
         try:
-            self.connection = sqlite3.connect(self.config['database'])
+            # sqlite3 keeps compiled statements per connection, keyed by query text
+            self.connection = sqlite3.connect(
+                self.config['database'],
+                cached_statements=self.config.get('cached_statements', 256)
+            )
+            self._apply_pragmas()
             logger.info("SQLite Database connected successfully.")
             self._create_table_if_not_exists()
         except sqlite3.Error as err:
             logger.error(f"Error connecting to SQLite Database: {err}")
             raise DatabaseConnectionError(err)
 
+    def _apply_pragmas(self):
+        """Apply DEFAULT_PRAGMAS merged with any pragmas given in the config."""
+        pragmas = {**DEFAULT_PRAGMAS, **self.config.get('pragmas', {})}
+        for name, value in pragmas.items():
+            self.connection.execute(f"PRAGMA {name}={value}")
+
     def disconnect(self):
         """Close the SQLite database connection."""
         if self.connection:
@@ -26,15 +47,69 @@ class SQLiteClient(BaseDatabase):
     def execute_query(self, query, params=None):
         """Execute a SQLite database query."""
         cursor = self.connection.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+        except sqlite3.Error:
+            # sqlite3 leaves the implicit transaction of a failed DML statement open
+            if not self._in_transaction:
+                self.connection.rollback()
+            raise
         if query.strip().lower().startswith("select"):
             return cursor.fetchall()
-        self.connection.commit()
+        if not self._in_transaction:
+            self.connection.commit()
+        return cursor.rowcount
+
+    def execute_many(self, query, seq_of_params):
+        """
+        Execute a query once per parameter tuple in a single transaction.
+
+        Args:
+            query (str): The SQL statement, e.g. an INSERT with ? placeholders.
+            seq_of_params (iterable): Parameter tuples; may be a generator.
+
+        Returns:
+            int: Number of affected rows.
+        """
+        if self._in_transaction:
+            cursor = self.connection.executemany(query, seq_of_params)
+        else:
+            # Commits once on success, rolls back on error
+            with self.connection:
+                cursor = self.connection.executemany(query, seq_of_params)
         return cursor.rowcount
 
+    def begin(self):
+        """
+        Start an explicit transaction; execute_query stops committing until commit() or rollback().
+
+        The BEGIN is sent right away, so DDL run inside the transaction, which
+        sqlite3 would otherwise autocommit, is rolled back too.
+        """
+        self.connection.execute("BEGIN")
+        self._in_transaction = True
+
+    def commit(self):
+        """Commit the current transaction."""
+        self.connection.commit()
+        self._in_transaction = False
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        self.connection.rollback()
+        self._in_transaction = False
+
+    def execute_query_iter(self, query, params=None):
+        """
+        Execute a SQLite SELECT and return the cursor for lazy iteration.
+
+        Rows are produced as the caller iterates, without building a list first.
+        """
+        return self.connection.execute(query, params or ())
+
     def _create_table_if_not_exists(self):
         """Create a table if it doesn't exist."""
         create_table_query = """
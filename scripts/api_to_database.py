@@ -1,7 +1,5 @@
-from templates.base_etl import BaseETL
-import pandas as pd
-import requests
-import sqlalchemy
+from templates.base_etl import BaseETL, get_engine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import time
 
@@ -17,8 +15,47 @@ class APIToDatabaseETL(BaseETL):
         ]
         self.validate_parameters(self.required_params)
 
+        # Split once here rather than for every page's response
+        data_path = self.parameters.get('data_path', '')
+        self._data_path_keys = tuple(data_path.split('.')) if data_path else ()
+        self._session = None
+
+    def _get_session(self):
+        """Return the HTTP session, creating it on first use"""
+        if self._session is not None:
+            return self._session
+
+        # Imported here so that constructing the job doesn't load requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # One pooled session for every page, so connections (and TLS) are reused
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=self.parameters.get('max_retries', 3),
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        return self._session
+
+    def _close_session(self):
+        """Close the HTTP session, if one is open"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def extract(self):
         """Extract data from API"""
+        import pandas as pd
+        import requests
+
         self.logger.info("Starting data extraction from API")
 
         headers = self.parameters.get('headers', {})
@@ -28,21 +65,23 @@ class APIToDatabaseETL(BaseETL):
         all_data = []
 
         try:
+            session = self._get_session()
             if pagination:
-                page = pagination.get('start_page', 1)
+                start_page = page = pagination.get('start_page', 1)
                 page_size = pagination.get('page_size', 100)
                 max_pages = pagination.get('max_pages', float('inf'))
 
                 while page <= max_pages:
-                    params.update({
+                    page_params = {
+                        **params,
                         pagination['page_param']: page,
                         pagination['size_param']: page_size
-                    })
+                    }
 
-                    response = requests.get(
+                    response = session.get(
                         self.parameters['api_url'],
                         headers=headers,
-                        params=params
+                        params=page_params
                     )
                     response.raise_for_status()
 
@@ -59,6 +98,17 @@ class APIToDatabaseETL(BaseETL):
                     if len(results) < page_size:
                         break
 
+                    # With the page count known from the first response, fetch the rest concurrently
+                    if pagination.get('parallel') and page == start_page:
+                        total_pages = self._get_total_pages(data, pagination)
+                        if total_pages:
+                            # Pages may be numbered from 0; max_pages caps the page number, as in the loop
+                            last_page = min(start_page + total_pages - 1, max_pages)
+                            all_data.extend(self._fetch_pages(
+                                range(page + 1, int(last_page) + 1), headers, params, pagination, page_size
+                            ))
+                            break
+
                     page += 1
 
                     # Respect rate limits
@@ -66,7 +116,7 @@ class APIToDatabaseETL(BaseETL):
                         time.sleep(1 / self.parameters['rate_limit'])
 
             else:
-                response = requests.get(
+                response = session.get(
                     self.parameters['api_url'],
                     headers=headers,
                     params=params
@@ -79,24 +129,68 @@ class APIToDatabaseETL(BaseETL):
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {str(e)}")
             raise
+        finally:
+            self._close_session()
 
-        df = pd.DataFrame(all_data)
+        schema = self.parameters.get('schema')
+        try:
+            import pyarrow as pa
+        except ImportError:  # optional, only used to build typed frames from a known schema
+            pa = None
+
+        if schema and pa is not None:
+            # Known column types: skip pandas' per-row dtype inference and keep Arrow strings
+            arrow_schema = pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in schema.items()])
+            df = pa.Table.from_pylist(all_data, schema=arrow_schema).to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            df = pd.DataFrame(all_data)
         self.logger.info(f"Extracted {len(df)} records from API")
 
         return df
 
+    def _get_total_pages(self, response_data, pagination):
+        """Read the total page count from a response, or None if it doesn't report one"""
+        value = response_data
+        for key in pagination.get('total_pages_path', 'total_pages').split('.'):
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        return value
+
+    def _fetch_pages(self, pages, headers, params, pagination, page_size):
+        """Fetch pages concurrently over the shared session and return their records in page order"""
+        session = self._get_session()
+
+        def fetch(page):
+            page_params = {**params, pagination['page_param']: page, pagination['size_param']: page_size}
+            response = session.get(self.parameters['api_url'], headers=headers, params=page_params)
+            response.raise_for_status()
+            results = self._extract_data_from_response(response.json())
+            self.logger.info(f"Fetched page {page}, got {len(results)} records")
+            return results
+
+        rate_limit = self.parameters.get('rate_limit')
+        with ThreadPoolExecutor(max_workers=pagination.get('max_workers', 8)) as executor:
+            futures = []
+            for page in pages:
+                futures.append(executor.submit(fetch, page))
+                # Respect rate limits by spacing out the requests as they are started
+                if rate_limit:
+                    time.sleep(1 / rate_limit)
+            return [record for future in futures for record in future.result()]
+
     def _extract_data_from_response(self, response_data):
         """Extract relevant data from API response"""
-        data_path = self.parameters.get('data_path', '')
-
-        if data_path:
-            for key in data_path.split('.'):
-                response_data = response_data[key]
+        for key in self._data_path_keys:
+            response_data = response_data[key]
 
         return response_data
 
     def transform(self, data):
         """Transform the API data"""
+        import numpy as np
+        import pandas as pd
+
         self.logger.info("Starting data transformation")
 
         # Apply column mappings
@@ -111,19 +205,28 @@ class APIToDatabaseETL(BaseETL):
 
         # Apply filters if specified
         filters = self.parameters.get('filters', [])
-        for filter_condition in filters:
-            column = filter_condition['column']
-            operator = filter_condition['operator']
-            value = filter_condition['value']
-
-            if operator == 'equals':
-                data = data[data[column] == value]
-            elif operator == 'greater_than':
-                data = data[data[column] > value]
-            elif operator == 'less_than':
-                data = data[data[column] < value]
-            elif operator == 'in':
-                data = data[data[column].isin(value)]
+        if filters:
+            # AND every condition into one mask and slice once, instead of copying the frame per filter
+            mask = np.ones(len(data), dtype=bool)
+            for filter_condition in filters:
+                column = data[filter_condition['column']]
+                operator = filter_condition['operator']
+                value = filter_condition['value']
+
+                if operator == 'equals':
+                    condition = column == value
+                elif operator == 'greater_than':
+                    condition = column > value
+                elif operator == 'less_than':
+                    condition = column < value
+                elif operator == 'in':
+                    condition = column.isin(value)
+                else:
+                    continue
+                mask &= condition.to_numpy(dtype=bool, na_value=False)
+
+            # An owned frame, so the column transformations below don't write into a slice
+            data = data.loc[mask].copy()
 
         # Apply transformations
         transformations = self.parameters.get('transformations', [])
@@ -146,19 +249,17 @@ class APIToDatabaseETL(BaseETL):
         """Load data into the database"""
         self.logger.info("Starting data load")
 
-        engine = sqlalchemy.create_engine(self.parameters['database_url'])
         table_name = self.parameters['target_table']
+        if_exists = self.parameters.get('if_exists', 'append')
 
         try:
-            # Load data in chunks
-            chunk_size = self.parameters.get('chunk_size', 1000)
-            data.to_sql(
-                name=table_name,
-                con=engine,
-                if_exists=self.parameters.get('if_exists', 'append'),
-                index=False,
-                chunksize=chunk_size
-            )
+            if self.parameters.get('use_adbc'):
+                self.write_dataframe_adbc(data, self.parameters['database_url'], table_name, if_exists)
+            else:
+                # Load data in chunks; without chunk_size they are sized to the database's parameter limit
+                engine = get_engine(self.parameters['database_url'])
+                chunk_size = self.parameters.get('chunk_size')
+                self.write_dataframe(data, engine, table_name, if_exists, chunk_size)
 
             self.logger.info(f"Successfully loaded {len(data)} records to {table_name}")
 
@@ -166,6 +267,3 @@ class APIToDatabaseETL(BaseETL):
             self.logger.error(f"Error loading data to database: {str(e)}")
             raise
 
-        finally:
-            engine.dispose()
-
@@ -1,8 +1,28 @@
-from templates.base_etl import BaseETL
-import pandas as pd
-import sqlalchemy
+from templates.base_etl import BaseETL, get_engine
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 import glob
+import hashlib
+import os
+import tempfile
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pd.read_csv's default missing-value markers, so Arrow reads the same cells as null
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+def _import_pyarrow():
+    """Return the pyarrow module, or None when it isn't installed"""
+    try:
+        import pyarrow
+    except ImportError:  # optional, falls back to pandas' single-threaded parser
+        return None
+    return pyarrow
 
 class CSVToDatabaseETL(BaseETL):
     """ETL job to load CSV files into a database"""
@@ -16,9 +36,18 @@ class CSVToDatabaseETL(BaseETL):
             'database_url'
         ]
         self.validate_parameters(self.required_params)
+        self._chunks_loaded = 0
 
     def extract(self):
-        """Extract data from CSV files"""
+        """
+        Extract data from CSV files.
+
+        With 'stream' set, returns an iterator of DataFrames of about
+        'stream_chunk_size' rows instead, so each chunk is transformed and loaded
+        before the next is read; drop_duplicates then only applies within a chunk.
+        With pyarrow, streamed columns without a dtype_mappings entry are read as
+        strings, so every chunk has the same dtypes.
+        """
         self.logger.info("Starting data extraction from CSV")
 
         source_path = Path(self.parameters['source_path'])
@@ -30,34 +59,202 @@ class CSVToDatabaseETL(BaseETL):
         if not files:
             raise FileNotFoundError(f"No files found matching pattern: {file_pattern}")
 
+        encoding = self.parameters.get('encoding', 'utf-8')
+        delimiter = self.parameters.get('delimiter', ',')
+
+        self._chunks_loaded = 0
+        if self.parameters.get('stream'):
+            return self._iter_chunks(files)
+
+        import pandas as pd
+
         # Read and combine all matching CSV files
-        dfs = []
+        pa = _import_pyarrow()
+        if pa is not None:
+            import pyarrow.csv as pacsv
+
+            # Arrow tokenizes each file on multiple threads; convert to pandas once at the end,
+            # keeping Arrow-backed columns (string[pyarrow] is far smaller than object strings)
+            read_options = pacsv.ReadOptions(use_threads=True, encoding=encoding)
+            parse_options = pacsv.ParseOptions(delimiter=delimiter)
+            tables = []
+            for file in files:
+                self.logger.info(f"Reading file: {file}")
+                tables.append(self._read_table(file, read_options, parse_options))
+
+            try:
+                combined = pa.concat_tables(tables, promote_options='permissive')
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                # A column typed differently across files, e.g. int64 in one and string
+                # in another; pd.concat merges those into an object column
+                combined_df = pd.concat([table.to_pandas(types_mapper=pd.ArrowDtype) for table in tables],
+                                        ignore_index=True)
+            else:
+                # self_destruct releases each Arrow column once its pandas block is built
+                combined_df = combined.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+                del combined
+            del tables
+        else:
+            # pd.read_csv releases the GIL while parsing, so files can be read side by side
+            with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+                dfs = list(executor.map(self._read_frame, files))
+
+            combined_df = pd.concat(dfs, ignore_index=True)
+        self.logger.info(f"Extracted {len(combined_df)} records from {len(files)} files")
+
+        return combined_df
+
+    def _iter_chunks(self, files):
+        """Yield the rows of all files as DataFrames of about stream_chunk_size rows."""
+        chunk_size = self.parameters.get('stream_chunk_size', 100_000)
+        encoding = self.parameters.get('encoding', 'utf-8')
+        delimiter = self.parameters.get('delimiter', ',')
+        columns = self.parameters.get('columns')
+
+        import pandas as pd
+
+        pa = _import_pyarrow()
+        if pa is not None:
+            import pyarrow.csv as pacsv
+
         for file in files:
-            self.logger.info(f"Reading file: {file}")
-            df = pd.read_csv(
+            self.logger.info(f"Streaming file: {file}")
+            if pa is None:
+                yield from pd.read_csv(file, encoding=encoding, delimiter=delimiter,
+                                       usecols=columns, chunksize=chunk_size)
+                continue
+
+            read_options = pacsv.ReadOptions(use_threads=True, encoding=encoding)
+            parse_options = pacsv.ParseOptions(delimiter=delimiter)
+            with pacsv.open_csv(file, read_options=read_options, parse_options=parse_options) as header:
+                names = header.schema.names
+            reader = pacsv.open_csv(
                 file,
-                encoding=self.parameters.get('encoding', 'utf-8'),
-                delimiter=self.parameters.get('delimiter', ',')
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=self._convert_options(columns, self._stream_column_types(names))
             )
-            dfs.append(df)
+            batches = []
+            rows = 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= chunk_size:
+                    yield pa.Table.from_batches(batches).to_pandas(types_mapper=pd.ArrowDtype)
+                    batches = []
+                    rows = 0
+            if batches:
+                yield pa.Table.from_batches(batches).to_pandas(types_mapper=pd.ArrowDtype)
 
-        combined_df = pd.concat(dfs, ignore_index=True)
-        self.logger.info(f"Extracted {len(combined_df)} records from {len(files)} files")
+    def _read_frame(self, file: str) -> 'pd.DataFrame':
+        """Read one CSV file with pandas, for when pyarrow is not installed."""
+        import pandas as pd
 
-        return combined_df
+        self.logger.info(f"Reading file: {file}")
+        return pd.read_csv(
+            file,
+            encoding=self.parameters.get('encoding', 'utf-8'),
+            delimiter=self.parameters.get('delimiter', ','),
+            usecols=self.parameters.get('columns')
+        )
+
+    def _stream_column_types(self, names):
+        """
+        Arrow types for streamed columns: the dtype_mappings type where one resolves, string otherwise.
+
+        open_csv infers types from the first block only, so a later value that
+        doesn't fit, e.g. 'A1B2' in a column of numbers, would abort the read.
+        """
+        import pyarrow as pa
+
+        column_mappings = self.parameters.get('column_mappings', {})
+        dtype_mappings = self.parameters.get('dtype_mappings', {})
+        column_types = {}
+        for name in names:
+            dtype = dtype_mappings.get(column_mappings.get(name, name))
+            try:
+                column_types[name] = pa.string() if dtype is None else self._arrow_type(dtype)
+            except ValueError:  # e.g. 'category'; transform converts the string column
+                column_types[name] = pa.string()
+        return column_types
+
+    @staticmethod
+    def _convert_options(columns=None, column_types=None):
+        """
+        Arrow CSV conversion options that treat missing values like pd.read_csv.
+
+        Blank and NA-marker cells become null in string columns too, instead of
+        Arrow's default of keeping them as text.
+        """
+        import pyarrow.csv as pacsv
+
+        return pacsv.ConvertOptions(
+            column_types=column_types or {},
+            include_columns=columns or [],
+            null_values=PANDAS_NA_VALUES,
+            strings_can_be_null=True
+        )
+
+    def _read_table(self, file: str, read_options, parse_options):
+        """
+        Read one CSV file into an Arrow table.
+
+        With 'parquet_cache_path' set, the parsed file is kept there as ZSTD Parquet,
+        keyed by its absolute path and read options, and reused until the CSV is
+        modified again, so reruns skip CSV parsing and read only the requested
+        'columns'.
+        """
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+
+        columns = self.parameters.get('columns')
+        cache_path = self.parameters.get('parquet_cache_path')
+        if not cache_path:
+            return pacsv.read_csv(file, read_options=read_options, parse_options=parse_options,
+                                  convert_options=self._convert_options(columns))
+
+        # Same-named files from different directories, or read with other options, get their own entry
+        key = repr((os.path.abspath(file), read_options.encoding, parse_options.delimiter, PANDAS_NA_VALUES))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+        cache_file = Path(cache_path) / f"{Path(file).name}.{digest}.parquet"
+        if cache_file.exists() and cache_file.stat().st_mtime >= Path(file).stat().st_mtime:
+            self.logger.info(f"Using Parquet cache: {cache_file}")
+            return pq.read_table(cache_file, columns=columns)
+
+        table = pacsv.read_csv(file, read_options=read_options, parse_options=parse_options,
+                               convert_options=self._convert_options())
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved into place, so a crashed or concurrent run never
+        # leaves a truncated file where later runs would read it as the cache
+        fd, tmp_file = tempfile.mkstemp(dir=cache_file.parent, prefix=f"{cache_file.name}.", suffix='.tmp')
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_file, compression='zstd', use_dictionary=True)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+        return table.select(columns) if columns else table
 
     def transform(self, data):
         """Transform the data"""
         self.logger.info("Starting data transformation")
 
+        # Arrow-backed frames go through every step as one Arrow table, without a pandas copy per step
+        transformed = self._transform_arrow(data)
+        if transformed is not None:
+            self.logger.info(f"Transformation complete. Final record count: {len(transformed)}")
+            return transformed
+
         # Apply any column mappings
         column_mappings = self.parameters.get('column_mappings', {})
         if column_mappings:
             data = data.rename(columns=column_mappings)
 
-        # Apply data type conversions
+        # Apply data type conversions; Arrow dtypes such as 'int64[pyarrow]' are accepted too
         dtype_mappings = self.parameters.get('dtype_mappings', {})
         if dtype_mappings:
+            data = self._arrow_to_numpy_columns(data, dtype_mappings)
             data = data.astype(dtype_mappings)
 
         # Handle missing values
@@ -70,7 +267,7 @@ class CSVToDatabaseETL(BaseETL):
         for transformation in custom_transformations:
             if transformation == 'drop_duplicates':
                 subset = self.parameters.get('duplicate_subset')
-                data = data.drop_duplicates(subset=subset)
+                data = self._drop_duplicates(data, subset)
             elif transformation == 'drop_na':
                 subset = self.parameters.get('na_subset')
                 data = data.dropna(subset=subset)
@@ -78,26 +275,160 @@ class CSVToDatabaseETL(BaseETL):
         self.logger.info(f"Transformation complete. Final record count: {len(data)}")
         return data
 
+    @staticmethod
+    def _arrow_to_numpy_columns(data, dtype_mappings):
+        """
+        Give Arrow-backed columns mapped to a non-Arrow dtype their numpy form first.
+
+        Nullable integers become float64 with NaN, as pd.read_csv would have read
+        them, so astype('int64') raises on missing values instead of casting
+        nulls to arbitrary integers like a direct Arrow-to-numpy cast does.
+        """
+        import pandas as pd
+
+        columns = [
+            column for column, dtype in dtype_mappings.items()
+            if column in data.columns and isinstance(data[column].dtype, pd.ArrowDtype)
+            and not isinstance(pd.api.types.pandas_dtype(dtype), pd.ArrowDtype)
+        ]
+        if not columns:
+            return data
+
+        import pyarrow as pa
+
+        numpy_columns = pa.Table.from_pandas(data[columns], preserve_index=False).to_pandas(ignore_metadata=True)
+        numpy_columns.index = data.index
+        data = data.copy(deep=False)
+        for column in columns:
+            data[column] = numpy_columns[column]
+        return data
+
+    def _transform_arrow(self, data):
+        """
+        Apply transform's steps to an Arrow-backed frame on a single Arrow table.
+
+        Returns None, leaving the work to pandas, when pyarrow isn't installed,
+        some column isn't Arrow-backed, a dtype mapping has no Arrow equivalent
+        or Arrow can't carry out a step.
+        """
+        import pandas as pd
+
+        pa = _import_pyarrow()
+        if pa is None or not all(isinstance(dtype, pd.ArrowDtype) for dtype in data.dtypes):
+            return None
+        import pyarrow.compute as pc
+
+        try:
+            target_types = {
+                column: self._arrow_type(dtype)
+                for column, dtype in self.parameters.get('dtype_mappings', {}).items()
+            }
+        except ValueError:  # e.g. 'category' or 'datetime64[ns]'
+            return None
+
+        column_mappings = self.parameters.get('column_mappings', {})
+        null_replacements = self.parameters.get('null_replacements', {})
+
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            if column_mappings:
+                table = table.rename_columns([column_mappings.get(name, name) for name in table.column_names])
+
+            for i, name in enumerate(table.column_names):
+                column = table.column(i)
+                if name in target_types and column.type != target_types[name]:
+                    column = column.cast(target_types[name])
+                if name in null_replacements and column.null_count:
+                    column = pc.fill_null(column, pa.scalar(null_replacements[name], type=column.type))
+                if column is not table.column(i):
+                    table = table.set_column(i, name, column)
+
+            for transformation in self.parameters.get('custom_transformations', []):
+                if transformation == 'drop_duplicates':
+                    subset = self.parameters.get('duplicate_subset')
+                    keys = [subset] if isinstance(subset, str) else list(subset or table.column_names)
+                    table = self._first_occurrences(table, keys)
+                elif transformation == 'drop_na':
+                    subset = self.parameters.get('na_subset')
+                    keys = [subset] if isinstance(subset, str) else list(subset or table.column_names)
+                    condition = pc.field(keys[0]).is_valid()
+                    for key in keys[1:]:
+                        condition &= pc.field(key).is_valid()
+                    table = table.filter(condition)
+        except pa.ArrowException:  # e.g. a lossy cast; pandas applies its own rules
+            return None
+
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    @staticmethod
+    def _arrow_type(dtype):
+        """Resolve a dtype mapping such as 'int64', 'string' or 'int64[pyarrow]' to an Arrow type"""
+        import pandas as pd
+        import pyarrow as pa
+
+        if isinstance(dtype, pd.ArrowDtype):
+            return dtype.pyarrow_dtype
+        name = str(dtype)
+        if name.endswith('[pyarrow]'):
+            name = name[:-len('[pyarrow]')]
+        return pa.type_for_alias(name)
+
+    @staticmethod
+    def _first_occurrences(table, keys):
+        """Keep the first row for each distinct combination of keys, in table order"""
+        import numpy as np
+        import pyarrow as pa
+
+        row_column = '__row_number'
+        table = table.append_column(row_column, pa.array(np.arange(len(table))))
+
+        # The smallest row number per key is its first occurrence
+        first_rows = (
+            table.group_by(keys)
+            .aggregate([(row_column, 'min')])
+            .sort_by(f'{row_column}_min')
+            .column(f'{row_column}_min')
+        )
+        return table.take(first_rows).drop_columns([row_column])
+
+    def _drop_duplicates(self, data, subset=None):
+        """
+        Drop duplicate rows, keeping the first, like DataFrame.drop_duplicates.
+
+        Arrow-backed frames are deduplicated with Arrow's hash group_by instead
+        of pandas' object hashing; the result has a fresh RangeIndex.
+        """
+        import pandas as pd
+
+        pa = _import_pyarrow()
+        if pa is None or not all(isinstance(dtype, pd.ArrowDtype) for dtype in data.dtypes):
+            return data.drop_duplicates(subset=subset)
+
+        keys = [subset] if isinstance(subset, str) else list(subset or data.columns)
+        try:
+            table = self._first_occurrences(pa.Table.from_pandas(data, preserve_index=False), keys)
+        except pa.ArrowNotImplementedError:  # key types Arrow can't hash, e.g. nested lists
+            return data.drop_duplicates(subset=subset)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
     def load(self, data):
         """Load data into the database"""
         self.logger.info("Starting data load")
 
-        engine = sqlalchemy.create_engine(self.parameters['database_url'])
         table_name = self.parameters['target_table']
 
-        # Determine if table should be replaced or appended
-        if_exists = self.parameters.get('if_exists', 'append')
+        # Determine if table should be replaced or appended; later streamed chunks always append
+        if_exists = 'append' if self._chunks_loaded else self.parameters.get('if_exists', 'append')
 
         try:
-            # Load data in chunks
-            chunk_size = self.parameters.get('chunk_size', 1000)
-            data.to_sql(
-                name=table_name,
-                con=engine,
-                if_exists=if_exists,
-                index=False,
-                chunksize=chunk_size
-            )
+            if self.parameters.get('use_adbc'):
+                self.write_dataframe_adbc(data, self.parameters['database_url'], table_name, if_exists)
+            else:
+                # Load data in chunks; without chunk_size they are sized to the database's parameter limit
+                engine = get_engine(self.parameters['database_url'])
+                chunk_size = self.parameters.get('chunk_size')
+                self.write_dataframe(data, engine, table_name, if_exists, chunk_size)
+            self._chunks_loaded += 1
 
             self.logger.info(f"Successfully loaded {len(data)} records to {table_name}")
 
@@ -105,9 +436,6 @@ class CSVToDatabaseETL(BaseETL):
             self.logger.error(f"Error loading data to database: {str(e)}")
             raise
 
-        finally:
-            engine.dispose()
-
 def main():
     """Main entry point for the ETL job"""
     # Example parameters
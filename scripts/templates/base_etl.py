@@ -1,9 +1,80 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+import csv
+import functools
+import io
 import logging
 import time
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 from datetime import datetime
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Bound-parameter limits for pandas' multi-row INSERT; other dialects get DEFAULT_MAX_INSERT_PARAMS
+MAX_INSERT_PARAMS = {
+    'sqlite': 999,
+    'mssql': 2100,
+}
+DEFAULT_MAX_INSERT_PARAMS = 65535
+
+# adbc_ingest modes matching to_sql's if_exists values
+ADBC_INGEST_MODES = {
+    'append': 'create_append',
+    'replace': 'replace',
+    'fail': 'create',
+}
+
+
+def insert_with_copy(pd_table, conn, keys, data_iter):
+    """
+    pandas.to_sql insertion method for psycopg2 that streams each chunk into
+    the table with COPY ... FROM STDIN in CSV format instead of INSERTs.
+    """
+    # Shared with PostgresqlGenericCRUD, so both loaders write cells the same way
+    from database.copy_format import COPY_NULL, copy_value
+
+    preparer = conn.dialect.identifier_preparer
+    table = preparer.quote(pd_table.name)
+    if pd_table.schema:
+        table = f"{preparer.quote_schema(pd_table.schema)}.{table}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    writer.writerows([copy_value(value) for value in row] for row in data_iter)
+    buffer.seek(0)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '{COPY_NULL}')",
+            buffer
+        )
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+@functools.lru_cache(maxsize=8)
+def get_engine(database_url: str):
+    """
+    Return a SQLAlchemy engine for database_url, created once per process.
+
+    Jobs run back to back in the same process share the engine and its
+    connection pool instead of building and disposing one per load.
+    """
+    # Imported on first use, so loading job modules doesn't pull in SQLAlchemy
+    import sqlalchemy
+
+    url = sqlalchemy.engine.make_url(database_url)
+    options = {'pool_pre_ping': True}
+    if url.get_backend_name() != 'sqlite':
+        options.update(pool_size=5, max_overflow=10)
+    if url.get_driver_name() == 'psycopg2':
+        options['executemany_mode'] = 'values_plus_batch'
+    return sqlalchemy.create_engine(url, **options)
+
 
 class BaseETL(ABC):
     """Base class for all ETL jobs"""
@@ -43,8 +114,13 @@ class BaseETL(ABC):
 
             # Main ETL steps
             data = self.extract()
-            transformed_data = self.transform(data)
-            self.load(transformed_data)
+            if isinstance(data, Iterator):
+                # Streaming extract: transform and load one chunk at a time
+                for chunk in data:
+                    self.load(self.transform(chunk))
+            else:
+                transformed_data = self.transform(data)
+                self.load(transformed_data)
 
             # Post-execution hooks
             self.post_execute()
@@ -69,7 +145,7 @@ class BaseETL(ABC):
 
     @abstractmethod
     def extract(self):
-        """Data extraction step"""
+        """Data extraction step; may return an iterator of chunks to stream them"""
         pass
 
     @abstractmethod
@@ -82,6 +158,60 @@ class BaseETL(ABC):
         """Data loading step"""
         pass
 
+    def write_dataframe(self, data: 'pd.DataFrame', engine, table_name: str,
+                        if_exists: str = 'append', chunk_size: int = None):
+        """
+        Write a DataFrame to a table in one transaction.
+
+        PostgreSQL over psycopg2 loads each chunk with COPY FROM STDIN; other
+        databases use pandas' 'multi' method. Those INSERT chunks are as many
+        rows as fit in the dialect's bound-parameter limit, or chunk_size if
+        that is smaller.
+        """
+        dialect = engine.dialect
+        if dialect.name == 'postgresql' and dialect.driver == 'psycopg2':
+            method = insert_with_copy
+        else:
+            method = 'multi'
+            max_params = MAX_INSERT_PARAMS.get(dialect.name, DEFAULT_MAX_INSERT_PARAMS)
+            rows_per_batch = max(1, max_params // max(1, len(data.columns)))
+            chunk_size = min(chunk_size, rows_per_batch) if chunk_size else rows_per_batch
+
+        with engine.begin() as conn:
+            data.to_sql(
+                name=table_name,
+                con=conn,
+                if_exists=if_exists,
+                index=False,
+                chunksize=chunk_size,
+                method=method
+            )
+
+    def write_dataframe_adbc(self, data: 'pd.DataFrame', database_url: str, table_name: str,
+                             if_exists: str = 'append'):
+        """
+        Write a DataFrame to a PostgreSQL table through ADBC's Arrow ingestion.
+
+        The frame is handed over as an Arrow table, which the driver streams with
+        binary COPY, so no Python object is created per row. Needs pyarrow and
+        adbc-driver-postgresql.
+        """
+        import adbc_driver_postgresql.dbapi
+        import pyarrow as pa
+        import sqlalchemy
+
+        url = sqlalchemy.engine.make_url(database_url)
+        if url.get_backend_name() != 'postgresql':
+            raise ValueError(f"use_adbc only supports PostgreSQL, not {url.get_backend_name()}")
+        # libpq URI without SQLAlchemy's +driver suffix
+        uri = url.set(drivername='postgresql').render_as_string(hide_password=False)
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        with adbc_driver_postgresql.dbapi.connect(uri) as conn:
+            with conn.cursor() as cursor:
+                cursor.adbc_ingest(table_name, table, mode=ADBC_INGEST_MODES[if_exists])
+            conn.commit()
+
     def get_parameter(self, key: str, default: Any = None) -> Any:
         """Safely get a parameter value"""
         return self.parameters.get(key, default)
@@ -1,29 +1,18 @@
+import json
 import subprocess
-import pkg_resources
 import sys
 from typing import List, Tuple
 import argparse
 from datetime import datetime
+from pathlib import Path
 
 def get_outdated_packages() -> List[Tuple[str, str, str]]:
     """Get list of outdated packages with their versions"""
-    outdated = []
-    for dist in pkg_resources.working_set:
-        latest = None
-        try:
-            latest = subprocess.check_output(
-                [sys.executable, '-m', 'pip', 'install', '{}==random'.format(dist.key)],
-                stderr=subprocess.STDOUT
-            ).decode('utf-8')
-        except subprocess.CalledProcessError as e:
-            latest = e.output.decode('utf-8')
-
-        if 'versions: ' in latest:
-            latest_version = latest.split('versions: ')[-1].split(',')[0].strip()
-            if latest_version != dist.version:
-                outdated.append((dist.key, dist.version, latest_version))
-
-    return outdated
+    # A single pip call reports every outdated package, instead of one probe per installed package
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'pip', 'list', '--outdated', '--format=json']
+    )
+    return [(pkg['name'], pkg['version'], pkg['latest_version']) for pkg in json.loads(output)]
 
 def update_package(package: str, specific_version: str = None) -> bool:
     """Update a specific package"""
@@ -42,28 +31,27 @@ def update_package(package: str, specific_version: str = None) -> bool:
     except subprocess.CalledProcessError:
         return False
 
-def backup_requirements():
-    """Backup current requirements.txt"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+def freeze_requirements(path: str) -> bool:
+    """Write the output of pip freeze to path"""
     try:
-        subprocess.check_call([
+        # Run pip directly and write the file ourselves; no shell needed for the redirection
+        output = subprocess.check_output([
             sys.executable, '-m', 'pip', 'freeze',
-            '>', f'requirements_backup_{timestamp}.txt'
-        ], shell=True)
+            '--all', '--exclude-editable'
+        ])
+        Path(path).write_bytes(output)
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         return False
 
+def backup_requirements():
+    """Backup current requirements.txt"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return freeze_requirements(f'requirements_backup_{timestamp}.txt')
+
 def update_requirements():
     """Update requirements.txt with current package versions"""
-    try:
-        subprocess.check_call([
-            sys.executable, '-m', 'pip', 'freeze',
-            '>', 'requirements.txt'
-        ], shell=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return freeze_requirements('requirements.txt')
 
 def main():
     parser = argparse.ArgumentParser(description='Package Update Utility')